@@ -1,4 +1,15 @@
 import { NextRequest, NextResponse } from 'next/server';
+import type { CityResolution } from '@/lib/services/cityResolver';
+
+// Resolutions from the AI service, shared across users. cityResolver's client-side
+// cache only lives for one browser session; this one lets every client reuse a
+// resolution for popular destinations and common misspellings.
+const MAX_CACHED_RESOLUTIONS = 500;
+const resolutionCache = new Map<string, CityResolution>();
+
+function normalizeCityInput(cityInput: string): string {
+  return cityInput.trim().toLowerCase().replace(/\s+/g, ' ');
+}
 
 export async function POST(request: NextRequest) {
   try {
@@ -11,6 +22,15 @@ export async function POST(request: NextRequest) {
       );
     }
 
+    const cacheKey = normalizeCityInput(cityInput);
+    const cached = resolutionCache.get(cacheKey);
+    if (cached) {
+      // Refresh recency so frequently requested cities stay cached
+      resolutionCache.delete(cacheKey);
+      resolutionCache.set(cacheKey, cached);
+      return NextResponse.json({ ...cached, original: cityInput });
+    }
+
     // Use Gemini to resolve and correct city names
     const prompt = `
 You are a travel assistant that helps resolve city names for flight bookings. 
@@ -68,13 +88,21 @@ Be precise and return valid JSON only.
         throw new Error('Invalid AI response format');
       }
 
-      return NextResponse.json({
+      const resolution: CityResolution = {
         original: cityInput,
         resolved: cityResolution.resolved,
         confidence: cityResolution.confidence || 0.8,
         country: cityResolution.country,
         alternatives: cityResolution.alternatives || []
-      });
+      };
+
+      if (resolutionCache.size >= MAX_CACHED_RESOLUTIONS) {
+        const oldestKey = resolutionCache.keys().next().value;
+        if (oldestKey !== undefined) resolutionCache.delete(oldestKey);
+      }
+      resolutionCache.set(cacheKey, resolution);
+
+      return NextResponse.json(resolution);
 
     } catch (parseError) {
       // If JSON parsing fails, use a simpler approach